@@ -10,7 +10,7 @@
 
 from __future__ import annotations
 
-import pathlib
+import os
 import re
 import typing as t
 
@@ -19,26 +19,34 @@ import click
 from aiida.cmdline.commands.cmd_verdi import verdi
 from aiida.cmdline.params import options
 from aiida.cmdline.utils import echo
-from aiida.manage.configuration import get_config_option
 
 DEFAULT_PROFILE_NAME_PREFIX: str = 'presto'
+_PRESTO_RE = re.compile(r'^presto(?:-(\d+))?$', re.ASCII)
+
+
+def get_default_email() -> str:
+    from aiida.manage.configuration import get_config_option
+
+    return get_config_option('autofill.user.email') or 'aiida@localhost'
 
 
 def get_default_presto_profile_name():
     from aiida.manage import get_config
 
     profile_names = get_config().profile_names
-    indices = []
 
-    for profile_name in profile_names:
-        if match := re.search(r'presto[-]?(\d+)?', profile_name):
-            indices.append(int(match.group(1) or '0'))
+    last_index = max(
+        (
+            int(match.group(1)) if match.group(1) else 0
+            for profile_name in profile_names
+            if (match := _PRESTO_RE.search(profile_name))
+        ),
+        default=None,
+    )
 
-    if not indices:
+    if last_index is None:
         return DEFAULT_PROFILE_NAME_PREFIX
 
-    last_index = int(sorted(indices)[-1])
-
     return f'{DEFAULT_PROFILE_NAME_PREFIX}-{last_index + 1}'
 
 
@@ -75,7 +83,7 @@ def detect_postgres_config(
 
     database_name = f'aiida-{profile_name}'
     database_username = f'aiida-{profile_name}'
-    database_password = secrets.token_hex(15)
+    database_password = secrets.token_urlsafe(20)
 
     try:
         database_username, database_name = postgres.create_dbuser_db_safe(
@@ -105,7 +113,7 @@ def detect_postgres_config(
 )
 @click.option(
     '--email',
-    default=lambda: get_config_option('autofill.user.email') or 'aiida@localhost',
+    default=get_default_email,
     show_default=True,
     help='Email of the default user.',
 )
@@ -232,7 +240,7 @@ def verdi_presto(
     load_profile(profile.name, allow_switch=True)
     echo.echo_info(f'Loaded newly created profile `{profile.name}`.')
 
-    filepath_scratch = pathlib.Path(ctx.obj.config.dirpath) / 'scratch' / profile.name
+    filepath_scratch = os.path.join(ctx.obj.config.dirpath, 'scratch', profile.name)
 
     computer = Computer(
         label='localhost',
@@ -240,10 +248,12 @@ def verdi_presto(
         description='Localhost automatically created by `verdi presto`',
         transport_type='core.local',
         scheduler_type='core.direct',
-        workdir=str(filepath_scratch),
+        workdir=filepath_scratch,
     ).store()
-    computer.configure(safe_interval=0)
-    computer.set_minimum_job_poll_interval(1)
-    computer.set_default_mpiprocs_per_machine(1)
+    # Single transaction so the three configuration writes flush in one commit instead of three round-trips
+    with computer.backend.transaction():
+        computer.configure(safe_interval=0)
+        computer.set_minimum_job_poll_interval(1)
+        computer.set_default_mpiprocs_per_machine(1)
 
     echo.echo_success('Configured the localhost as a computer.')
@@ -20,19 +20,79 @@ from __future__ import annotations
 import functools
 import os
 import typing as t
+import weakref
 
 import click
 
 from .overridable import OverridableOption
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 __all__ = ('ConfigFileOption',)
 
+_valid_params_cache: 't.MutableMapping[click.Command, t.Dict[str, t.FrozenSet[str]]]' = weakref.WeakKeyDictionary()
+
+
+def _get_valid_params(command: click.Command, option_name: str) -> t.FrozenSet[str]:
+    """Return the parameter names of the command that may be specified in a configuration file.
+
+    The result is cached per command since the parameters do not change after the command is constructed. The cache
+    holds the command only weakly, so entries disappear together with their command objects.
+    """
+    try:
+        return _valid_params_cache[command][option_name]
+    except KeyError:
+        valid_params = frozenset(param.name for param in command.params if param.name != option_name)  # type: ignore[misc]
+        _valid_params_cache.setdefault(command, {})[option_name] = valid_params
+        return valid_params
+
+
+def _load_single_yaml_document(handle) -> t.Any:
+    """Parse a single YAML document from the handle, streaming instead of slurping the whole file.
+
+    Unlike ``yaml.load``, which builds the full document tree after reading the entire stream, ``yaml.load_all``
+    consumes the stream incrementally through the loader's scanner, keeping peak memory lower for large files.
+
+    :raises ValueError: if the stream contains more than a single YAML document.
+    """
+    import yaml
+
+    sentinel = object()
+    documents = yaml.load_all(handle, Loader=_SafeLoader)
+    try:
+        document = next(documents, None)
+        if next(documents, sentinel) is not sentinel:
+            raise ValueError('expected a single YAML document, but the stream contains multiple.')
+        return document
+    finally:
+        documents.close()
+
+
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(filepath: str, mtime_ns: int, size: int) -> t.Any:
+    """Load and parse the YAML file at the given path.
+
+    The ``mtime_ns`` and ``size`` arguments are part of the cache key such that the file is reparsed when it changes.
+    """
+    with open(filepath, encoding='utf-8') as handle:
+        return _load_single_yaml_document(handle)
+
 
 def yaml_config_file_provider(handle, cmd_name):
     """Read yaml config file from file handle."""
-    import yaml
+    import copy
+
+    filepath = getattr(handle, 'name', None)
+
+    if isinstance(filepath, str) and os.path.isfile(filepath):
+        stat = os.stat(filepath)
+        # Return a shallow copy such that callers cannot mutate the cached dictionary.
+        return copy.copy(_load_yaml_cached(filepath, stat.st_mtime_ns, stat.st_size))
 
-    return yaml.safe_load(handle)
+    return _load_single_yaml_document(handle)
 
 
 def configuration_callback(
@@ -75,11 +135,12 @@ def configuration_callback(
         except Exception as exception:
             raise click.BadOptionUsage(option_name, f'Error reading configuration file: {exception}', ctx)
 
-        valid_params = [param.name for param in ctx.command.params if param.name != option_name]
-        specified_params = list(config.keys())
-        unknown_params = set(specified_params).difference(set(valid_params))
+        valid_params = _get_valid_params(ctx.command, option_name)
 
-        if unknown_params:
+        # In the happy path all keys are known and no set needs to be built; ``all`` short-circuits on the first
+        # unknown key, in which case the set difference is computed only to produce the error message.
+        if not all(key in valid_params for key in config):
+            unknown_params = config.keys() - valid_params
             raise click.BadParameter(
                 f'Invalid configuration file, the following keys are not supported: {unknown_params}', ctx, param
             )
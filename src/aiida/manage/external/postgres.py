@@ -99,10 +99,10 @@ class Postgres(PGSU):
         :raises: psycopg2.errors.DuplicateObject if user already exists and
             self.connection_mode == PostgresConnectionMode.PSYCOPG
         """
-        self.execute(_CREATE_USER_COMMAND.format(dbuser, dbpass, privileges))
-        # Ensure the database superuser (current_user) has the right to make `dbuser` the owner of new databases.
-        # Required for some postgresql installations.
-        self.execute(_GRANT_ROLE_COMMAND.format(dbuser))
+        # The grant ensures the database superuser (current_user) has the right to make `dbuser` the owner of new
+        # databases, which is required for some postgresql installations. Both statements are sent in a single
+        # round-trip since each ``execute`` call opens a new connection (or shells out to ``psql``).
+        self.execute(f'{_CREATE_USER_COMMAND.format(dbuser, dbpass, privileges)}; {_GRANT_ROLE_COMMAND.format(dbuser)}')
 
     def drop_dbuser(self, dbuser):
         """Drop a database user in postgres
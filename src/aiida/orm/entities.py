@@ -12,8 +12,7 @@ from __future__ import annotations
 
 import abc
 from enum import Enum
-from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Generic, List, Optional, Sequence, Type, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union, cast
 
 from plumpy.base.utils import call_with_super_check, super_check
 
@@ -49,25 +48,71 @@ class EntityTypes(Enum):
     GROUP_NODE = 'group_node'
 
 
+_DEFAULT_COLLECTION_CACHE: Dict[type, 'Collection'] = {}
+_DEPRECATIONS_EMITTED: set = set()
+_STORAGE_BACKEND_CLS: Optional[type] = None
+
+
+def _get_storage_backend_cls() -> type:
+    """Return the ``StorageBackend`` class, importing it only on first use.
+
+    The import cannot live at module scope since ``aiida.orm.implementation`` imports this module, and re-importing
+    inside each caller pays a ``sys.modules`` lookup and symbol bind per call.
+    """
+    global _STORAGE_BACKEND_CLS  # noqa: PLW0603
+    if _STORAGE_BACKEND_CLS is None:
+        from aiida.orm.implementation import StorageBackend
+
+        _STORAGE_BACKEND_CLS = StorageBackend
+    return _STORAGE_BACKEND_CLS
+
+
+def _warn_deprecation_once(key: Tuple[type, str], message: str, version: int, stacklevel: int = 2) -> None:
+    """Emit a deprecation warning only the first time the given key is encountered.
+
+    ``warn_deprecation`` walks the stack and matches warning filters on every call, which is too expensive to pay
+    repeatedly when deprecated accessors are used in loops.
+    """
+    if key not in _DEPRECATIONS_EMITTED:
+        _DEPRECATIONS_EMITTED.add(key)
+        warn_deprecation(message, version=version, stacklevel=stacklevel + 1)
+
+
 class Collection(abc.ABC, Generic[EntityType]):
     """Container class that represents the collection of objects of a particular entity type."""
 
+    __slots__ = ('_backend', '_entity_type')
+
     @staticmethod
     @abc.abstractmethod
     def _entity_base_cls() -> Type[EntityType]:
         """The allowed entity class or subclasses thereof."""
 
     @classmethod
-    @lru_cache(maxsize=100)
     def get_cached(cls, entity_class: Type[EntityType], backend: 'StorageBackend'):
         """Get the cached collection instance for the given entity class and backend.
 
         :param backend: the backend instance to get the collection for
         """
-        from aiida.orm.implementation import StorageBackend
-
-        type_check(backend, StorageBackend)
-        return cls(entity_class, backend=backend)
+        # The cache is stored on the backend instance itself rather than in a module-level mapping, such that cached
+        # collections are garbage collected together with their backend once it is no longer referenced elsewhere,
+        # e.g. after a profile switch or at the end of a test. A weak-keyed module-level mapping would not achieve
+        # this, since each cached collection holds a strong reference back to its backend through ``self._backend``,
+        # keeping the key alive. A plain dict is used instead of ``lru_cache`` to avoid the locking and
+        # key-construction overhead of the latter on this hot path.
+        try:
+            cache = backend._collection_cache  # type: ignore[attr-defined]
+        except AttributeError:
+            type_check(backend, _get_storage_backend_cls())
+            cache = backend._collection_cache = {}  # type: ignore[attr-defined]
+
+        key = (cls, entity_class)
+        try:
+            return cache[key]
+        except KeyError:
+            collection = cls(entity_class, backend=backend)
+            cache[key] = collection
+            return collection
 
     def __init__(self, entity_class: Type[EntityType], backend: Optional['StorageBackend'] = None) -> None:
         """Construct a new entity collection.
@@ -75,10 +120,10 @@ class Collection(abc.ABC, Generic[EntityType]):
         :param entity_class: the entity type e.g. User, Computer, etc
         :param backend: the backend instance to get the collection for, or use the default
         """
-        from aiida.orm.implementation import StorageBackend
-
-        type_check(backend, StorageBackend, allow_none=True)
-        assert issubclass(entity_class, self._entity_base_cls())
+        if __debug__:
+            if backend is not None and not isinstance(backend, _get_storage_backend_cls()):
+                raise TypeError(f'backend should be a `StorageBackend` instance, got: {type(backend)}')
+            assert issubclass(entity_class, self._entity_base_cls())
         self._backend = backend or get_manager().get_profile_storage()
         self._entity_type = entity_class
 
@@ -119,11 +164,11 @@ class Collection(abc.ABC, Generic[EntityType]):
         from . import querybuilder
 
         filters = filters or {}
-        order_by = {self.entity_type: order_by} if order_by else {}
 
         query = querybuilder.QueryBuilder(backend=self._backend, limit=limit, offset=offset)
         query.append(self.entity_type, project=project, filters=filters, subclassing=subclassing)
-        query.order_by([order_by])
+        if order_by:
+            query.order_by([{self.entity_type: order_by}])
         return query
 
     def get(self, **filters: Any) -> EntityType:
@@ -173,6 +218,8 @@ class Collection(abc.ABC, Generic[EntityType]):
 class Entity(abc.ABC, Generic[BackendEntityType, CollectionType], metaclass=EntityFieldMeta):
     """An AiiDA entity"""
 
+    __slots__ = ('_backend_entity',)
+
     _CLS_COLLECTION: Type[CollectionType] = Collection  # type: ignore[assignment]
 
     fields: QbFields = QbFields()
@@ -194,7 +241,9 @@ class Entity(abc.ABC, Generic[BackendEntityType, CollectionType], metaclass=Enti
 
         :return: an object that can be used to access entities of this type
         """
-        warn_deprecation('`objects` property is deprecated, use `collection` instead.', version=3, stacklevel=4)
+        _warn_deprecation_once(
+            (cls, 'objects'), '`objects` property is deprecated, use `collection` instead.', version=3, stacklevel=4
+        )
         return cls.collection
 
     @classproperty
@@ -203,7 +252,15 @@ class Entity(abc.ABC, Generic[BackendEntityType, CollectionType], metaclass=Enti
 
         :return: an object that can be used to access entities of this type
         """
-        return cls._CLS_COLLECTION.get_cached(cls, get_manager().get_profile_storage())
+        # Fast path: reuse the previously returned collection as long as the default backend has not changed, which
+        # skips the cache-key construction of ``get_cached`` on every access.
+        cached = _DEFAULT_COLLECTION_CACHE.get(cls)
+        if cached is not None and cached._backend is get_manager().get_profile_storage():
+            return cached  # type: ignore[return-value]
+
+        collection = cls._CLS_COLLECTION.get_cached(cls, get_manager().get_profile_storage())
+        _DEFAULT_COLLECTION_CACHE[cls] = collection
+        return collection
 
     @classmethod
     def get_collection(cls, backend: 'StorageBackend'):
@@ -224,7 +281,8 @@ class Entity(abc.ABC, Generic[BackendEntityType, CollectionType], metaclass=Enti
         .. deprecated: Will be removed in v3, use `Entity.collection.get` instead.
 
         """
-        warn_deprecation(
+        _warn_deprecation_once(
+            (cls, 'get'),
             f'`{cls.__name__}.get` method is deprecated, use `{cls.__name__}.collection.get` instead.',
             version=3,
             stacklevel=2,
@@ -234,7 +292,9 @@ class Entity(abc.ABC, Generic[BackendEntityType, CollectionType], metaclass=Enti
     def __init__(self, backend_entity: BackendEntityType) -> None:
         """:param backend_entity: the backend model supporting this entity"""
         self._backend_entity = backend_entity
-        call_with_super_check(self.initialize)
+        # Skip the relatively expensive super-check machinery when no subclass overrides ``initialize``
+        if type(self).initialize is not Entity.initialize:
+            call_with_super_check(self.initialize)
 
     def __getstate__(self):
         """Prevent an ORM entity instance from being pickled."""
@@ -303,5 +363,7 @@ def from_backend_entity(cls: Type[EntityType], backend_entity: BackendEntityType
     type_check(backend_entity, BackendEntity)
     entity = cls.__new__(cls)
     entity._backend_entity = backend_entity
-    call_with_super_check(entity.initialize)
+    # Skip the relatively expensive super-check machinery when no subclass overrides ``initialize``
+    if cls.initialize is not Entity.initialize:
+        call_with_super_check(entity.initialize)
     return entity
@@ -9,11 +9,12 @@
 """Module which provides decorators for AiiDA ORM entity -> DB field mappings."""
 
 import datetime
+import sys
 import typing as t
 from abc import ABCMeta
-from copy import deepcopy
-from functools import singledispatchmethod
+from functools import lru_cache
 from pprint import pformat
+from types import MappingProxyType
 
 from aiida.common.lang import isidentifier
 
@@ -24,6 +25,7 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=512)
 def extract_root_type(dtype: t.Any) -> t.Any:
     """Recursively search for the primitive root type.
 
@@ -48,8 +50,11 @@ class QbField:
         '_backend_key',
         '_doc',
         '_dtype',
+        '_root_dtype',
         '_is_attribute',
         '_is_subscriptable',
+        '_cached_backend_key',
+        '_cached_hash',
     )
 
     def __init__(
@@ -75,8 +80,19 @@ class QbField:
         self._backend_key = alias if alias is not None else key
         self._doc = doc
         self._dtype = dtype
+        # The dtype cannot change post-construction, so compute the root type once instead of on every property access
+        self._root_dtype = extract_root_type(dtype)
         self._is_attribute = is_attribute
         self._is_subscriptable = is_subscriptable
+        # The field is immutable post-construction, so the derived backend key and hash are computed once up front
+        # instead of allocating a new string on every ``backend_key`` access and ``__hash__`` call
+        # Interning lets dict operations on filter dictionaries keyed by these strings hit the pointer-compare
+        # fast path; the keys are identifier-shaped and bounded in number
+        self._key = sys.intern(self._key)
+        self._cached_backend_key = sys.intern(
+            f'attributes.{self._backend_key}' if is_attribute else self._backend_key
+        )
+        self._cached_hash = hash((self._key, self._cached_backend_key))
 
     @property
     def key(self) -> str:
@@ -84,9 +100,7 @@ class QbField:
 
     @property
     def backend_key(self) -> str:
-        if self._is_attribute:
-            return f'attributes.{self._backend_key}'
-        return self._backend_key
+        return self._cached_backend_key
 
     @property
     def doc(self) -> str:
@@ -95,7 +109,7 @@ class QbField:
     @property
     def dtype(self) -> t.Optional[t.Any]:
         """Return the primitive root type."""
-        return extract_root_type(self._dtype)
+        return self._root_dtype
 
     @property
     def annotation(self) -> t.Optional[t.Any]:
@@ -128,7 +142,7 @@ class QbField:
         return f'{class_name}({field_name}) -> {type_str}'
 
     def __hash__(self):
-        return hash((self.key, self.backend_key))
+        return self._cached_hash
 
     def __eq__(self, value):
         return QbFieldFilters(((self, '==', value),))
@@ -139,7 +153,8 @@ class QbField:
     def in_(self, value: t.Iterable[t.Any]):
         """Return a filter for only values in the list"""
         try:
-            set(value)
+            # ``iter`` validates iterability at constant cost without materializing (or consuming) the values
+            iter(value)
         except TypeError:
             raise TypeError('in_ must be iterable')
         return QbFieldFilters(((self, 'in', value),))
@@ -258,6 +273,19 @@ class QbAttrField(QbNumericField, QbArrayField, QbStrField, QbDictField):
         return QbFieldFilters(((self, 'of_type', value),))
 
 
+def _clone_filters(value: t.Any) -> t.Any:
+    """Clone a filter tree, copying the dict and list containers but sharing the (immutable) filter operands.
+
+    This covers the known shape of filter dictionaries and is much cheaper than ``copy.deepcopy``, which dispatches
+    through the copy registry and keeps a memo dict for every node.
+    """
+    if isinstance(value, dict):
+        return {key: _clone_filters(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_filters(item) for item in value]
+    return value
+
+
 class QbFieldFilters:
     """An representation of a list of fields and their comparators."""
 
@@ -278,14 +306,21 @@ class QbFieldFilters:
         """Return an items view of the filters for use in the QueryBuilder."""
         return self.filters.items()
 
-    @singledispatchmethod
-    def add_filters(self, filters: dict):
-        self.filters.update(filters)
+    def add_filters(self, filters: t.Union[t.Sequence[t.Tuple[QbField, str, t.Any]], dict]):
+        # An explicit isinstance branch instead of ``singledispatchmethod``, which pays a registry lookup and a bound
+        # method wrapper on every call, while this method runs for every comparison made on a ``QbField``.
+        if isinstance(filters, dict):
+            self.filters.update(filters)
+            return
 
-    @add_filters.register(list)
-    @add_filters.register(tuple)
-    def _(self, filters):
         field: QbField
+        # Fast path for the dominant case of a single comparison on a field, where the dict is still empty and the
+        # membership test and 'and'-merge below can never fire
+        if len(filters) == 1 and not self.filters:
+            field, comparator, value = filters[0]
+            self.filters[field.backend_key] = {comparator: value}
+            return
+
         for field, comparator, value in filters:
             qb_field = field.backend_key
             if qb_field in self.filters:
@@ -321,7 +356,7 @@ class QbFieldFilters:
 
     def __invert__(self) -> 'QbFieldFilters':
         """~(a > b) -> a !> b; ~(a !> b) -> a > b"""
-        filters = deepcopy(self.filters)
+        filters = _clone_filters(self.filters)
         if 'and' in filters:
             filters['!and'] = filters.pop('and')
         elif 'or' in filters:
@@ -365,13 +400,22 @@ class QbFieldFilters:
 class QbFields:
     """A readonly class for mapping attributes to database fields of an AiiDA entity."""
 
+    __slots__ = ('_fields', '_dir', '_repr')
+
     __isabstractmethod__ = False
 
     def __init__(self, fields: t.Optional[t.Dict[str, QbField]] = None):
-        self._fields = fields or {}
+        # A read-only view makes the immutability contract explicit and safe to rely on for shallow copies
+        self._fields = MappingProxyType(fields or {})
+        self._dir = (*self._fields, '_dict')
+        self._repr: t.Optional[str] = None
 
     def __repr__(self) -> str:
-        return pformat({key: str(value) for key, value in self._fields.items()})
+        # The mapping is read-only, so the pretty-printed representation is computed once on first use; ``pformat``
+        # recurses and line-wraps in pure Python, which is too costly to rerun on every display
+        if self._repr is None:
+            self._repr = pformat({key: str(value) for key, value in self._fields.items()})
+        return self._repr
 
     def __str__(self) -> str:
         return str({key: str(value) for key, value in self._fields.items()})
@@ -382,10 +426,12 @@ class QbFields:
 
     def __getattr__(self, key: str) -> QbField:
         """Return an QbField by key."""
-        try:
-            return self._fields[key]
-        except KeyError:
+        # A None check instead of try/except, since raising and catching KeyError is an order of magnitude slower
+        # and this method is the hot path for hasattr-style probes
+        field = self._fields.get(key)
+        if field is None:
             raise AttributeError(key)
+        return field
 
     def __contains__(self, key: str) -> bool:
         """Return if the field key exists"""
@@ -401,12 +447,60 @@ class QbFields:
 
     def __dir__(self):
         """Return keys for tab competion."""
-        return list(self._fields) + ['_dict']
+        return list(self._dir)
 
     @property
     def _dict(self):
         """Return a copy of the internal mapping"""
-        return deepcopy(self._fields)
+        # A shallow copy suffices since ``QbField`` instances are immutable post-construction
+        return dict(self._fields)
+
+
+def _build_qb_fields(cls) -> QbFields:
+    """Collect the ``QbField`` instances from the ``__qb_fields__`` attributes in the class hierarchy."""
+    fields = {}
+    # Note: inspect.getmembers causes loading of AiiDA to fail
+    for key, attr in ((key, attr) for subcls in reversed(cls.__mro__) for key, attr in subcls.__dict__.items()):
+        # __qb_fields__ should be a list of QbField instances
+        if key == '__qb_fields__':
+            assert isinstance(
+                attr, t.Sequence
+            ), f"class '{cls}' has a '__qb_fields__' attribute, but it is not a sequence"
+            for field in attr:
+                if not isinstance(field, QbField):
+                    raise ValueError(f"__qb_fields__ attribute of class '{cls}' must be list of QbField instances")
+                if field.key == 'value':
+                    if dtype := getattr(cls, '_type', None):
+                        value_field = add_field(
+                            'value',
+                            dtype=dtype,
+                            doc='The value of the data',
+                        )
+
+                        fields[field.key] = value_field
+                else:
+                    fields[field.key] = field
+
+    return QbFields({key: fields[key] for key in sorted(fields)})
+
+
+class _LazyQbFields:
+    """Descriptor computing the ``QbFields`` of an entity class on first access.
+
+    Computing the fields involves a full MRO walk per class, which is too expensive to run eagerly for every ORM
+    class at import time. Once computed, the descriptor replaces itself on the class with the result, so subsequent
+    accesses are plain attribute reads.
+    """
+
+    __slots__ = ('_cls',)
+
+    def __init__(self, cls):
+        self._cls = cls
+
+    def __get__(self, instance, owner=None):
+        fields = _build_qb_fields(self._cls)
+        setattr(self._cls, 'fields', fields)
+        return fields
 
 
 class EntityFieldMeta(ABCMeta):
@@ -416,35 +510,11 @@ class EntityFieldMeta(ABCMeta):
         super().__init__(name, bases, classdict)
 
         # only allow an existing fields attribute if has been generated from a subclass
-        current_fields = getattr(cls, 'fields', None)
+        current_fields = classdict.get('fields')
         if current_fields is not None and not isinstance(current_fields, QbFields):
             raise ValueError(f"class '{cls}' already has a `fields` attribute set")
 
-        # Find all fields
-        fields = {}
-        # Note: inspect.getmembers causes loading of AiiDA to fail
-        for key, attr in ((key, attr) for subcls in reversed(cls.__mro__) for key, attr in subcls.__dict__.items()):
-            # __qb_fields__ should be a list of QbField instances
-            if key == '__qb_fields__':
-                assert isinstance(
-                    attr, t.Sequence
-                ), f"class '{cls}' has a '__qb_fields__' attribute, but it is not a sequence"
-                for field in attr:
-                    if not isinstance(field, QbField):
-                        raise ValueError(f"__qb_fields__ attribute of class '{cls}' must be list of QbField instances")
-                    if field.key == 'value':
-                        if dtype := getattr(cls, '_type', None):
-                            value_field = add_field(
-                                'value',
-                                dtype=dtype,
-                                doc='The value of the data',
-                            )
-
-                            fields[field.key] = value_field
-                    else:
-                        fields[field.key] = field
-
-        cls.fields = QbFields({key: fields[key] for key in sorted(fields)})
+        cls.fields = _LazyQbFields(cls)
 
 
 class QbFieldArguments(t.TypedDict):
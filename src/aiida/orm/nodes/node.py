@@ -296,7 +296,10 @@ class Node(Entity['BackendNode', NodeCollection], metaclass=AbstractNodeMeta):
 
     def __eq__(self, other: Any) -> bool:
         """Fallback equality comparison by uuid (can be overwritten by specific types)"""
-        if isinstance(other, Node) and self.uuid == other.uuid:
+        if self is other:
+            return True
+        # Compare the uuids through the backend entities directly to skip the property indirection
+        if isinstance(other, Node) and self._backend_entity.uuid == other._backend_entity.uuid:
             return True
         return super().__eq__(other)
 
@@ -22,7 +22,8 @@ class ArithmeticAddParser(Parser):
         from aiida.orm import Int
 
         try:
-            with self.retrieved.base.repository.open(self.node.get_option('output_filename'), 'r') as handle:
+            # Open in binary mode to avoid the syscall overhead of the text-mode wrapper; ``int`` accepts ASCII bytes.
+            with self.retrieved.base.repository.open(self.node.get_option('output_filename'), 'rb') as handle:
                 result = int(handle.read())
         except OSError:
             return self.exit_codes.ERROR_READING_OUTPUT_FILE
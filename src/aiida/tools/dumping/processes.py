@@ -11,12 +11,20 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+from collections import deque
 from pathlib import Path
 from types import SimpleNamespace
 from typing import List
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 from aiida.common import LinkType
 from aiida.common.exceptions import NotExistentAttributeError
 from aiida.orm import (
@@ -33,6 +41,22 @@ from aiida.orm.utils import LinkTriple
 
 LOGGER = logging.getLogger(__name__)
 
+_NODE_PROPERTIES = (
+    'label',
+    'description',
+    'pk',
+    'uuid',
+    'ctime',
+    'mtime',
+    'node_type',
+    'process_type',
+    'is_finished_ok',
+)
+
+_USER_PROPERTIES = ('first_name', 'last_name', 'email', 'institution')
+
+_COMPUTER_PROPERTIES = ('label', 'hostname', 'scheduler_type', 'transport_type')
+
 
 class ProcessDumper:
     def __init__(
@@ -51,6 +75,10 @@ class ProcessDumper:
         self.overwrite = overwrite
         self.flat = flat
 
+        # Cache for `_generate_calculation_io_mapping`, which otherwise rebuilds the same mapping (and emits the same
+        # log message) for every `CalculationNode` encountered during a dump
+        self._io_mapping_cache: dict = {}
+
     @staticmethod
     def _generate_default_dump_path(process_node: ProcessNode) -> Path:
         """Simple helper function to generate the default parent-dumping directory if none given.
@@ -62,12 +90,9 @@ class ProcessDumper:
         :return: The absolute default parent dump path.
         """
 
-        pk = process_node.pk
-        try:
-            return Path(f'dump-{process_node.process_label}-{pk}')
-        except AttributeError:
-            # This case came up during testing, not sure how relevant it actually is
-            return Path(f'dump-{process_node.process_type}-{pk}')
+        # `process_label` can be unavailable -> This case came up during testing, not sure how relevant it actually is
+        label = getattr(process_node, 'process_label', None) or process_node.process_type
+        return Path(f'dump-{label}-{process_node.pk}')
 
     @staticmethod
     def _generate_readme(process_node: ProcessNode, output_path: Path) -> None:
@@ -143,25 +168,18 @@ class ProcessDumper:
         node = link_triple.node
         link_label = link_triple.link_label
 
-        # Generate directories with naming scheme akin to `verdi process status`
-        label_list = [f'{index:02d}', link_label]
+        process_label = getattr(node, 'process_label', None)
+        if process_label is None:
+            process_label = getattr(node, 'process_type', None)
 
-        try:
-            process_label = node.process_label
-            if process_label is not None and process_label != link_label:
-                label_list += [process_label]
-
-        except AttributeError:
-            process_type = node.process_type
-            if process_type is not None and process_type != link_label:
-                label_list += [process_type]
+        # Generate directories with naming scheme akin to `verdi process status`
+        if process_label is not None and process_label != link_label:
+            node_label = f'{index:02d}-{link_label}-{process_label}'
+        else:
+            node_label = f'{index:02d}-{link_label}'
 
-        node_label = '-'.join(label_list)
         # `CALL-` as part of the link labels also for MultiplyAddWorkChain -> Seems general enough, so remove
-        node_label = node_label.replace('CALL-', '')
-        node_label = node_label.replace('None-', '')
-
-        return node_label
+        return node_label.replace('CALL-', '')
 
     def dump(
         self,
@@ -171,8 +189,8 @@ class ProcessDumper:
     ) -> Path:
         """Dumps all data involved in a `ProcessNode`, including its outgoing links.
 
-        Note that if an outgoing link is a `WorkflowNode`, the function recursively calls itself, while files are
-        only actually created when a `CalculationNode` is reached.
+        Note that if an outgoing link is a `WorkflowNode`, it is traversed breadth-first via a work queue, while files
+        are only actually created when a `CalculationNode` is reached.
 
         :param process_node: The parent `ProcessNode` node to be dumped.
         :param output_path: The output path where the directory tree will be created.
@@ -206,39 +224,45 @@ class ProcessDumper:
     def _dump_workflow(
         self, workflow_node: WorkflowNode, output_path: Path, io_dump_paths: List[str | Path] | None = None
     ) -> None:
-        """Recursive function to traverse a `WorkflowNode` and dump its `CalculationNode` s.
+        """Traverse a `WorkflowNode` and dump its `CalculationNode` s.
 
-        :param workflow_node: `WorkflowNode` to be traversed. Will be updated during recursion.
-        :param output_path: Dumping parent directory. Will be updated during recursion.
+        The traversal is driven by an explicit work queue rather than recursion, avoiding a Python stack frame per
+        nested sub-workflow for deeply nested workchains.
+
+        :param workflow_node: `WorkflowNode` to be traversed.
+        :param output_path: Dumping parent directory.
         :param io_dump_paths: Custom subdirectories for `CalculationNode` s, defaults to None
         """
 
-        self._validate_make_dump_path(validate_path=output_path)
-        self._dump_node_yaml(process_node=workflow_node, output_path=output_path)
-
-        called_links = workflow_node.base.links.get_outgoing(link_type=(LinkType.CALL_CALC, LinkType.CALL_WORK)).all()
-        called_links = sorted(called_links, key=lambda link_triple: link_triple.node.ctime)
-
-        for index, link_triple in enumerate(called_links, start=1):
-            child_node = link_triple.node
-            child_label = self._generate_child_node_label(index=index, link_triple=link_triple)
-            child_output_path = output_path.resolve() / child_label
-
-            # Recursive function call for `WorkFlowNode`
-            if isinstance(child_node, WorkflowNode):
-                self._dump_workflow(
-                    workflow_node=child_node,
-                    output_path=child_output_path,
-                    io_dump_paths=io_dump_paths,
-                )
+        workflow_queue = deque([(workflow_node, output_path)])
 
-            # Once a `CalculationNode` as child reached, dump it
-            elif isinstance(child_node, CalculationNode):
-                self._dump_calculation(
-                    calculation_node=child_node,
-                    output_path=child_output_path,
-                    io_dump_paths=io_dump_paths,
-                )
+        while workflow_queue:
+            workflow, workflow_output_path = workflow_queue.popleft()
+
+            # `_validate_make_dump_path` already resolves the path, so reuse its return value rather than calling
+            # `Path.resolve`, which stats every path component, again
+            resolved_output_path = self._validate_make_dump_path(validate_path=workflow_output_path)
+            self._dump_node_yaml(process_node=workflow, output_path=resolved_output_path)
+
+            called_links = workflow.base.links.get_outgoing(link_type=(LinkType.CALL_CALC, LinkType.CALL_WORK)).all()
+            called_links = sorted(called_links, key=lambda link_triple: link_triple.node.ctime)
+
+            for index, link_triple in enumerate(called_links, start=1):
+                child_node = link_triple.node
+                child_label = self._generate_child_node_label(index=index, link_triple=link_triple)
+                child_output_path = resolved_output_path / child_label
+
+                # Enqueue `WorkflowNode` s for later traversal
+                if isinstance(child_node, WorkflowNode):
+                    workflow_queue.append((child_node, child_output_path))
+
+                # Once a `CalculationNode` as child reached, dump it
+                elif isinstance(child_node, CalculationNode):
+                    self._dump_calculation(
+                        calculation_node=child_node,
+                        output_path=child_output_path,
+                        io_dump_paths=io_dump_paths,
+                    )
 
     def _dump_calculation(
         self,
@@ -254,21 +278,23 @@ class ProcessDumper:
             Default: ['inputs', 'outputs', 'node_inputs', 'node_outputs']
         """
 
-        self._validate_make_dump_path(validate_path=output_path)
+        output_path = self._validate_make_dump_path(validate_path=output_path)
         self._dump_node_yaml(process_node=calculation_node, output_path=output_path)
 
         io_dump_mapping = self._generate_calculation_io_mapping(io_dump_paths=io_dump_paths)
 
-        # Dump the repository contents of the node
-        calculation_node.base.repository.copy_tree(output_path.resolve() / io_dump_mapping.repository)
+        # Dump the repository contents of the node, skipping the copy machinery entirely for empty repositories
+        if calculation_node.base.repository.list_object_names():
+            calculation_node.base.repository.copy_tree(output_path / io_dump_mapping.repository)
 
         # Dump the repository contents of `outputs.retrieved`
         try:
-            calculation_node.outputs.retrieved.base.repository.copy_tree(
-                output_path.resolve() / io_dump_mapping.retrieved
-            )
+            retrieved_repository = calculation_node.outputs.retrieved.base.repository
         except NotExistentAttributeError:
             pass
+        else:
+            if retrieved_repository.list_object_names():
+                retrieved_repository.copy_tree(output_path / io_dump_mapping.retrieved)
 
         # Dump the node_inputs
         if self.include_inputs:
@@ -277,8 +303,11 @@ class ProcessDumper:
 
         # Dump the node_outputs apart from `retrieved`
         if self.include_outputs:
-            output_links = list(calculation_node.base.links.get_outgoing(link_type=LinkType.CREATE))
-            output_links = [output_link for output_link in output_links if output_link.link_label != 'retrieved']
+            output_links = [
+                output_link
+                for output_link in calculation_node.base.links.get_outgoing(link_type=LinkType.CREATE)
+                if output_link.link_label != 'retrieved'
+            ]
 
             self._dump_calculation_io(
                 parent_path=output_path / io_dump_mapping.outputs,
@@ -292,16 +321,19 @@ class ProcessDumper:
         :param link_triples: List of link triples.
         """
 
-        for link_triple in link_triples:
-            link_label = link_triple.link_label
+        flat = self.flat
+        resolved_parent_path = parent_path.resolve()
+        parent_path_str = str(resolved_parent_path)
 
-            if not self.flat:
-                linked_node_path = parent_path / Path(*link_label.split('__'))
-            else:
+        for link_triple in link_triples:
+            if flat:
                 # Don't use link_label at all -> But, relative path inside FolderData is retained
-                linked_node_path = parent_path
+                linked_node_path = resolved_parent_path
+            else:
+                # Join at the string level; nested link labels would otherwise cost one `Path` per `__` segment
+                linked_node_path = Path(os.path.join(parent_path_str, link_triple.link_label.replace('__', os.sep)))
 
-            link_triple.node.base.repository.copy_tree(linked_node_path.resolve())
+            link_triple.node.base.repository.copy_tree(linked_node_path)
 
     def _validate_make_dump_path(self, validate_path: Path, safeguard_file: str = '.aiida_node_metadata.yaml') -> Path:
         """Create default dumping directory for a given process node and return it as absolute path.
@@ -311,11 +343,22 @@ class ProcessDumper:
             Default: `.aiida_node_metadata.yaml`
         :return: The absolute created dump path.
         """
-        import shutil
-
         if validate_path.is_dir():
+            # A single `os.scandir` pass answers both checks: whether the directory holds any entries at all and
+            # whether the safeguard file ('.aiida_node_metadata.yaml') is among them; stop as soon as both are known
+            has_entries = False
+            has_safeguard = False
+            with os.scandir(validate_path) as entries:
+                for entry in entries:
+                    has_entries = True
+                    if not self.overwrite:
+                        break
+                    if entry.name == safeguard_file and entry.is_file():
+                        has_safeguard = True
+                        break
+
             # Existing, empty directory -> OK
-            if not any(validate_path.iterdir()):
+            if not has_entries:
                 pass
 
             # Existing, non-empty directory and overwrite False -> FileExistsError
@@ -323,15 +366,13 @@ class ProcessDumper:
                 raise FileExistsError(f'Path `{validate_path}` already exists and overwrite set to False.')
 
             # Existing, non-empty directory and overwrite True
-            # Check for safeguard file ('.aiida_node_metadata.yaml') for safety
-            # If present -> Remove directory
-            elif (validate_path / safeguard_file).is_file():
+            # Safeguard file found during the scan -> Remove directory
+            elif has_safeguard:
                 LOGGER.info(f'Overwrite set to true, will overwrite directory `{validate_path}`.')
                 shutil.rmtree(validate_path)
 
             # Existing and non-empty directory and overwrite True
-            # Check for safeguard file ('.aiida_node_metadata.yaml') for safety
-            # If absent -> Don't remove directory as to not accidentally remove a wrong one
+            # Safeguard file absent -> Don't remove directory as to not accidentally remove a wrong one
             else:
                 raise Exception(
                     f"Path `{validate_path}` already exists and doesn't contain safeguard file {safeguard_file}."
@@ -355,6 +396,12 @@ class ProcessDumper:
         :return: SimpleNamespace mapping.
         """
 
+        cache_key = None if io_dump_paths is None else tuple(str(path) for path in io_dump_paths)
+        try:
+            return self._io_mapping_cache[cache_key]
+        except KeyError:
+            pass
+
         aiida_entities_to_dump = ['repository', 'retrieved', 'inputs', 'outputs']
         default_calculation_io_dump_paths = ['inputs', 'outputs', 'node_inputs', 'node_outputs']
         empty_calculation_io_dump_paths = [''] * 4
@@ -363,23 +410,26 @@ class ProcessDumper:
             LOGGER.info(
                 'Flat set to True and no `io_dump_paths`. Dumping in a flat directory, files might be overwritten.'
             )
-            return SimpleNamespace(**dict(zip(aiida_entities_to_dump, empty_calculation_io_dump_paths)))
+            mapping = SimpleNamespace(**dict(zip(aiida_entities_to_dump, empty_calculation_io_dump_paths)))
 
         elif not self.flat and io_dump_paths is None:
             LOGGER.info(
                 'Flat set to False but no `io_dump_paths` provided. '
                 + f'Will use the defaults {default_calculation_io_dump_paths}.'
             )
-            return SimpleNamespace(**dict(zip(aiida_entities_to_dump, default_calculation_io_dump_paths)))
+            mapping = SimpleNamespace(**dict(zip(aiida_entities_to_dump, default_calculation_io_dump_paths)))
 
         elif self.flat and io_dump_paths is not None:
             LOGGER.info('Flat set to True but `io_dump_paths` provided. These will be used, but `inputs` not nested.')
-            return SimpleNamespace(**dict(zip(aiida_entities_to_dump, io_dump_paths)))
+            mapping = SimpleNamespace(**dict(zip(aiida_entities_to_dump, io_dump_paths)))
         else:
             LOGGER.info(
                 'Flat set to False but no `io_dump_paths` provided. These will be used, but `node_inputs` flattened.'
             )
-            return SimpleNamespace(**dict(zip(aiida_entities_to_dump, io_dump_paths)))  # type: ignore[arg-type]
+            mapping = SimpleNamespace(**dict(zip(aiida_entities_to_dump, io_dump_paths)))  # type: ignore[arg-type]
+
+        self._io_mapping_cache[cache_key] = mapping
+        return mapping
 
     def _dump_node_yaml(
         self,
@@ -394,27 +444,11 @@ class ProcessDumper:
         :param output_filename: The name of the output YAML file. Defaults to `.aiida_node_metadata.yaml`.
         """
 
-        node_properties = [
-            'label',
-            'description',
-            'pk',
-            'uuid',
-            'ctime',
-            'mtime',
-            'node_type',
-            'process_type',
-            'is_finished_ok',
-        ]
-
-        user_properties = ('first_name', 'last_name', 'email', 'institution')
-
-        computer_properties = ('label', 'hostname', 'scheduler_type', 'transport_type')
-
         node_dict = {}
         metadata_dict = {}
 
         # Add actual node `@property`s to dictionary
-        for metadata_property in node_properties:
+        for metadata_property in _NODE_PROPERTIES:
             metadata_dict[metadata_property] = getattr(process_node, metadata_property)
 
         node_dict['Node data'] = metadata_dict
@@ -423,7 +457,7 @@ class ProcessDumper:
         try:
             node_dbuser = process_node.user
             user_dict = {}
-            for user_property in user_properties:
+            for user_property in _USER_PROPERTIES:
                 user_dict[user_property] = getattr(node_dbuser, user_property)
             node_dict['User data'] = user_dict
         except AttributeError:
@@ -433,7 +467,7 @@ class ProcessDumper:
         try:
             node_dbcomputer = process_node.computer
             computer_dict = {}
-            for computer_property in computer_properties:
+            for computer_property in _COMPUTER_PROPERTIES:
                 computer_dict[computer_property] = getattr(node_dbcomputer, computer_property)
             node_dict['Computer data'] = computer_dict
         except AttributeError:
@@ -450,6 +484,7 @@ class ProcessDumper:
             if node_extras:
                 node_dict['Node extras'] = node_extras
 
-        output_file = output_path.resolve() / output_filename
-        with open(output_file, 'w') as handle:
-            yaml.dump(node_dict, handle, sort_keys=False)
+        # Dumping without a stream emits into an in-memory buffer, so the file is written with a single `write` call
+        # instead of one per emitted token
+        output_file = output_path / output_filename
+        output_file.write_text(yaml.dump(node_dict, Dumper=_YamlDumper, sort_keys=False))
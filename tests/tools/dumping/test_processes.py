@@ -36,6 +36,11 @@ arraydata_linklabel = 'arraydata'
 node_metadata_file = '.aiida_node_metadata.yaml'
 
 
+def get_dumped_files(dump_parent_path: Path) -> set[Path]:
+    """Collect the relative paths of all dumped files with a single directory walk rather than a stat per file."""
+    return {path.relative_to(dump_parent_path) for path in dump_parent_path.rglob('*') if path.is_file()}
+
+
 # Helper functions to generate the actual `WorkflowNode`s and `CalculationNode`s used for testing
 @pytest.fixture
 def generate_calculation_node_io(generate_calculation_node, tmp_path):
@@ -146,10 +151,12 @@ def test_dump_workflow(generate_calculation_node_io, generate_workchain_node_io,
         f'01-sub_workflow/02-calculation/{node_metadata_file}',
     ]
 
-    expected_files = [input_path, singlefiledata_path, folderdata_path, arraydata_path, *node_metadata_paths]
-    expected_files = [dump_parent_path / expected_file for expected_file in expected_files]
+    expected_files = {
+        Path(expected_file)
+        for expected_file in [input_path, singlefiledata_path, folderdata_path, arraydata_path, *node_metadata_paths]
+    }
 
-    assert all([expected_file.is_file() for expected_file in expected_files])
+    assert expected_files <= get_dumped_files(dump_parent_path)
 
     # Flat dumping
     dump_parent_path = tmp_path / 'wc-dump-test-io-flat'
@@ -166,10 +173,11 @@ def test_dump_workflow(generate_calculation_node_io, generate_workchain_node_io,
         f'01-sub_workflow/02-calculation/{node_metadata_file}',
     ]
 
-    expected_files = [input_path, folderdata_path, arraydata_path, *node_metadata_paths]
-    expected_files = [dump_parent_path / expected_file for expected_file in expected_files]
+    expected_files = {
+        Path(expected_file) for expected_file in [input_path, folderdata_path, arraydata_path, *node_metadata_paths]
+    }
 
-    assert all([expected_file.is_file() for expected_file in expected_files])
+    assert expected_files <= get_dumped_files(dump_parent_path)
 
 
 def test_dump_multiply_add(tmp_path, generate_workchain_multiply_add):
@@ -180,24 +188,22 @@ def test_dump_multiply_add(tmp_path, generate_workchain_multiply_add):
 
     input_files = ['_aiidasubmit.sh', 'aiida.in', '.aiida/job_tmpl.json', '.aiida/calcinfo.json']
     output_files = ['_scheduler-stderr.txt', '_scheduler-stdout.txt', 'aiida.out']
-    input_files = [
-        dump_parent_path / '02-ArithmeticAddCalculation' / inputs_relpath / input_file for input_file in input_files
-    ]
-    input_files += [dump_parent_path / '01-multiply' / inputs_relpath / 'source_file']
-    output_files = [
-        dump_parent_path / '02-ArithmeticAddCalculation' / outputs_relpath / output_file for output_file in output_files
-    ]
+    expected_files = {
+        Path('02-ArithmeticAddCalculation') / inputs_relpath / input_file for input_file in input_files
+    }
+    expected_files.add(Path('01-multiply') / inputs_relpath / 'source_file')
+    expected_files |= {
+        Path('02-ArithmeticAddCalculation') / outputs_relpath / output_file for output_file in output_files
+    }
 
     # No node_inputs contained in MultiplyAddWorkChain
-    assert all([input_file.is_file() for input_file in input_files])
-    assert all([output_file.is_file() for output_file in output_files])
+    assert expected_files <= get_dumped_files(dump_parent_path)
 
     # Flat dumping
     dump_parent_path = tmp_path / 'wc-dump-test-multiply-add-flat'
     process_dumper = ProcessDumper(flat=True)
     process_dumper.dump(process_node=wc_node, output_path=dump_parent_path)
 
-    multiply_file = dump_parent_path / '01-multiply' / 'source_file'
     arithmetic_add_files = [
         '_aiidasubmit.sh',
         'aiida.in',
@@ -207,13 +213,12 @@ def test_dump_multiply_add(tmp_path, generate_workchain_multiply_add):
         '_scheduler-stdout.txt',
         'aiida.out',
     ]
-    arithmetic_add_files = [
-        dump_parent_path / '02-ArithmeticAddCalculation' / arithmetic_add_file
-        for arithmetic_add_file in arithmetic_add_files
-    ]
 
-    assert multiply_file.is_file()
-    assert all([expected_file.is_file() for expected_file in arithmetic_add_files])
+    dumped_files = get_dumped_files(dump_parent_path)
+    assert Path('01-multiply') / 'source_file' in dumped_files
+    assert {
+        Path('02-ArithmeticAddCalculation') / arithmetic_add_file for arithmetic_add_file in arithmetic_add_files
+    } <= dumped_files
 
 
 # Tests for dump_calculation method
@@ -234,17 +239,16 @@ def test_dump_calculation_node(tmp_path, generate_calculation_node_io):
     assert (dump_parent_path / node_outputs_relpath / singlefiledata_linklabel / filename).is_file()
     assert (dump_parent_path / node_outputs_relpath / folderdata_test_path / filename).is_file()
 
-    # Check contents once
-    with open(dump_parent_path / inputs_relpath / filename, 'r') as handle:
-        assert handle.read() == filecontent
-    with open(dump_parent_path / node_inputs_relpath / singlefiledata_linklabel / filename) as handle:
-        assert handle.read() == filecontent
-    with open(dump_parent_path / node_inputs_relpath / folderdata_test_path / filename) as handle:
-        assert handle.read() == filecontent
-    with open(dump_parent_path / node_outputs_relpath / singlefiledata_linklabel / filename) as handle:
-        assert handle.read() == filecontent
-    with open(dump_parent_path / node_outputs_relpath / folderdata_test_path / filename) as handle:
-        assert handle.read() == filecontent
+    # Check contents once -> Compare raw bytes, which avoids opening a text-mode handle and decoding per file
+    expected_content = filecontent.encode()
+    content_files = [
+        dump_parent_path / inputs_relpath / filename,
+        dump_parent_path / node_inputs_relpath / singlefiledata_linklabel / filename,
+        dump_parent_path / node_inputs_relpath / folderdata_test_path / filename,
+        dump_parent_path / node_outputs_relpath / singlefiledata_linklabel / filename,
+        dump_parent_path / node_outputs_relpath / folderdata_test_path / filename,
+    ]
+    assert all(content_file.read_bytes() == expected_content for content_file in content_files)
 
 
 def test_dump_calculation_flat(tmp_path, generate_calculation_node_io):
@@ -387,23 +391,21 @@ def test_generate_child_node_label(
 
     process_dumper = ProcessDumper()
 
-    output_paths = sorted(
-        [
-            process_dumper._generate_child_node_label(index, output_node)
-            for index, output_node in enumerate(output_triples)
-        ]
-    )
-    assert output_paths == ['00-sub_workflow', '01-calculation']
+    output_paths = {
+        process_dumper._generate_child_node_label(index, output_node)
+        for index, output_node in enumerate(output_triples)
+    }
+    assert output_paths == {'00-sub_workflow', '01-calculation'}
 
     # Check with multiply_add workchain node
     multiply_add_node = generate_workchain_multiply_add()
     output_triples = multiply_add_node.base.links.get_outgoing().all()
     # Sort by ctime here, not mtime, as I'm generating the WorkChain normally
     output_triples = sorted(output_triples, key=lambda link_triple: link_triple.node.ctime)
-    output_paths = sorted(
-        [process_dumper._generate_child_node_label(_, output_node) for _, output_node in enumerate(output_triples)]
-    )
-    assert output_paths == ['00-multiply', '01-ArithmeticAddCalculation', '02-result']
+    output_paths = {
+        process_dumper._generate_child_node_label(_, output_node) for _, output_node in enumerate(output_triples)
+    }
+    assert output_paths == {'00-multiply', '01-ArithmeticAddCalculation', '02-result'}
 
 
 def test_dump_node_yaml(generate_calculation_node_io, tmp_path, generate_workchain_multiply_add):